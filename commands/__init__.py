@@ -1,20 +1,81 @@
 # commands/__init__.py - Command registry
 
+import sys
+from typing import Optional
+
 # Global command registry
 COMMAND_REGISTRY = {}
 
+# Rendered help text, built on first use and reset by register()
+_HELP_CACHE: Optional[str] = None
+
+# Length of the longest registered command name, maintained by register()
+_MAX_CMD_LEN = 0
+
 def register(*names):
-   
+    """
+    Class decorator that adds a command to COMMAND_REGISTRY.
+
+    With no names, the command name is derived from the class name
+    (e.g. BlockCommand -> 'block'). Otherwise the class is registered
+    under every given name. Registering a name that already belongs to
+    a different class raises ValueError.
+
+    May also be applied bare, as @register, which behaves like @register().
+    """
+    if len(names) == 1 and isinstance(names[0], type):
+        # Used without parentheses: names[0] is the decorated class
+        return register()(names[0])
+
     def decorator(cls):
-        if not names:
-            # Auto-derive name from class name
-            cmd_name = cls.__name__.lower()
-            if cmd_name.endswith('command'):
-                cmd_name = cmd_name[:-7]  # Remove 'command' suffix
-            COMMAND_REGISTRY[cmd_name] = cls
-        else:
-            # Register with all provided names
-            for name in names:
-                COMMAND_REGISTRY[name] = cls
+        global _HELP_CACHE, _MAX_CMD_LEN
+        # Auto-derive name from class name when none are given
+        cmd_names = names or (cls.__name__.lower().removesuffix('command'),)
+        for name in cmd_names:
+            name = sys.intern(name)
+            existing = COMMAND_REGISTRY.get(name)
+            if existing is cls:
+                continue  # Re-registering the same class is a no-op
+            if existing is not None:
+                raise ValueError(
+                    f"Command name '{name}' is already registered to {existing.__name__}")
+            COMMAND_REGISTRY[name] = cls
+            _MAX_CMD_LEN = max(_MAX_CMD_LEN, len(name))
+            _HELP_CACHE = None
         return cls
-    return decorator
\ No newline at end of file
+    return decorator
+
+def lookup(name: str):
+    """Return the command class registered under name, or None"""
+    return COMMAND_REGISTRY.get(name)
+
+def build_help_text() -> str:
+    """
+    Return the help listing for all registered commands.
+
+    The first name registered for a class is its primary name; any later
+    names are listed as aliases. The text is cached until the next register().
+    """
+    global _HELP_CACHE
+    if _HELP_CACHE is not None:
+        return _HELP_CACHE
+
+    # Group names by command class in a single pass over the registry
+    groups = {}
+    for cmd_name, cmd_class in COMMAND_REGISTRY.items():
+        groups.setdefault(id(cmd_class), [cmd_class]).append(cmd_name)
+
+    lines = ["", "Available commands:"]
+    # Sort commands alphabetically by primary name
+    for cmd_class, primary_name, *_ in sorted(groups.values(), key=lambda g: g[1]):
+        lines.append(f"  {primary_name.ljust(_MAX_CMD_LEN + 2)}- {cmd_class.get_help()}")
+
+    aliases = [(group[1], group[2:]) for group in groups.values() if len(group) > 2]
+    if aliases:
+        lines.extend(["", "Command aliases:"])
+        for primary_name, alias_list in aliases:
+            lines.append(f"  {primary_name}: {', '.join(alias_list)}")
+
+    lines.extend(["", "Usage: command [arguments]"])
+    _HELP_CACHE = "\n".join(lines)
+    return _HELP_CACHE
\ No newline at end of file
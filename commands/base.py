@@ -1,5 +1,22 @@
 # commands/base.py - Base command class
 
+import sys
+import time
+import functools
+from typing import Optional
+
+# Translate table mapping non-printable bytes to '.'. This is the single
+# printable-ASCII helper; use Command._printable_ascii() for byte previews.
+_PRINTABLE = bytes(b if 32 <= b <= 126 else 0x2E for b in range(256))
+
+# Units used by _format_size, one per power of 1024
+_SIZE_UNITS = ('B', 'KiB', 'MiB', 'GiB', 'TiB')
+
+@functools.lru_cache(maxsize=None)
+def _format_utc(timestamp: int) -> str:
+    """Format a Unix timestamp as a UTC date string (cached per timestamp)"""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(timestamp))
+
 class Command:
     """Base class for all commands"""
     
@@ -15,12 +32,53 @@ class Command:
         """Execute the command with the given arguments"""
         raise NotImplementedError("Command subclasses must implement execute()")
     
+    def _parse_byte_count(self, args, default: int = 64) -> Optional[int]:
+        """
+        Parse an optional byte count argument for the dump commands.
+        
+        Accepts decimal or 0x-prefixed hex and clamps the result to the
+        data actually loaded. Returns None (after printing why) if the
+        argument is not a valid non-negative integer.
+        """
+        available = len(self.explorer.raw_data)
+        if not args:
+            return min(default, available)
+        
+        try:
+            count = int(args[0])
+        except ValueError:
+            try:
+                count = int(args[0], 0)
+            except ValueError:
+                print(f"Invalid byte count: '{args[0]}'")
+                return None
+        
+        if count < 0:
+            print(f"Byte count must not be negative: {count}")
+            return None
+        if count > available:
+            print(f"Only {available} bytes available; showing {available}.")
+            return available
+        return count
+    
+    @staticmethod
+    def _formatted_mtime(superblock) -> str:
+        """Return the superblock modification time as a UTC date string"""
+        return _format_utc(superblock.modification_time)
+    
     @staticmethod
     def _format_size(size_bytes: int) -> str:
         """Format byte size to human-readable format"""
-        # Convert bytes to human-readable format
-        for unit in ['B', 'KiB', 'MiB', 'GiB', 'TiB']:
-            if size_bytes < 1024.0 or unit == 'TiB':
-                break
-            size_bytes /= 1024.0
-        return f"{size_bytes:.2f} {unit}"
\ No newline at end of file
+        # Pick the unit from the bit length: each unit is 10 bits wider
+        shift = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1) if size_bytes > 0 else 0
+        return f"{size_bytes / (1 << (shift * 10)):.2f} {_SIZE_UNITS[shift]}"
+    
+    @staticmethod
+    def _write_lines(lines) -> None:
+        """Write all output lines with a single stdout call"""
+        sys.stdout.write("\n".join(lines) + "\n")
+    
+    @staticmethod
+    def _printable_ascii(data) -> str:
+        """Return data as ASCII with non-printable bytes shown as '.'"""
+        return bytes(data).translate(_PRINTABLE).decode('ascii')
\ No newline at end of file
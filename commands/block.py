@@ -15,5 +15,7 @@ class BlockCommand(Command):
             return
             
         sb = self.explorer.superblock
-        print(f"\nBlock size: {sb.block_size} bytes ({self._format_size(sb.block_size)})")
-        print(f"Block log: {sb.block_log} (2^{sb.block_log} = {sb.block_size})")
\ No newline at end of file
+        self._write_lines([
+            f"\nBlock size: {sb.block_size} bytes ({self._format_size(sb.block_size)})",
+            f"Block log: {sb.block_log} (2^{sb.block_log} = {sb.block_size})"
+        ])
\ No newline at end of file
@@ -2,7 +2,7 @@
 
 from commands.base import Command
 from commands import register
-from squashfs import CompressionID
+from squashfs import COMPRESSION_DESCRIPTIONS, compression_name
 
 @register()
 class CompressionCommand(Command):
@@ -16,23 +16,10 @@ class CompressionCommand(Command):
             return
             
         comp_id = self.explorer.superblock.compression_id
-        comp_name = "Unknown"
-        try:
-            comp_name = CompressionID(comp_id).name
-        except ValueError:
-            comp_name = f"Unknown ({comp_id})"
-        
-        print(f"\nCompression method: {comp_name} (ID: {comp_id})")
+        lines = [f"\nCompression method: {compression_name(comp_id)} (ID: {comp_id})"]
         
         # Additional info about the compression method
-        compression_info = {
-            CompressionID.GZIP: "Standard GZIP compression (zlib)",
-            CompressionID.LZMA: "LZMA compression, high compression ratio",
-            CompressionID.LZO: "LZO compression, optimized for speed",
-            CompressionID.XZ: "XZ compression, high compression ratio",
-            CompressionID.LZ4: "LZ4 compression, very fast decompression",
-            CompressionID.ZSTD: "Zstandard compression, good balance of speed and ratio"
-        }
+        if comp_id in COMPRESSION_DESCRIPTIONS:
+            lines.append(f"Description: {COMPRESSION_DESCRIPTIONS[comp_id]}")
         
-        if comp_id in compression_info:
-            print(f"Description: {compression_info[comp_id]}")
\ No newline at end of file
+        self._write_lines(lines)
\ No newline at end of file
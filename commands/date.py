@@ -1,6 +1,5 @@
 # commands/date.py - Date command
 
-import time
 from commands.base import Command
 from commands import register
 
@@ -15,6 +14,8 @@ class DateCommand(Command):
             print("No valid superblock found. Cannot determine date.")
             return
             
-        date_str = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(self.explorer.superblock.modification_time))
-        print(f"\nFilesystem creation date: {date_str} UTC")
-        print(f"Unix timestamp: {self.explorer.superblock.modification_time}")
\ No newline at end of file
+        date_str = self._formatted_mtime(self.explorer.superblock)
+        self._write_lines([
+            f"\nFilesystem creation date: {date_str} UTC",
+            f"Unix timestamp: {self.explorer.superblock.modification_time}"
+        ])
\ No newline at end of file
@@ -3,6 +3,22 @@
 from commands.base import Command
 from commands import register
 
+# Superblock flag names, indexed by bit position (0x0001 is bit 0)
+_FLAG_NAMES = (
+    "UNCOMPRESSED_INODES",
+    "UNCOMPRESSED_DATA",
+    "CHECK",
+    "UNCOMPRESSED_FRAGMENTS",
+    "NO_FRAGMENTS",
+    "ALWAYS_FRAGMENTS",
+    "DUPLICATES",
+    "EXPORTABLE",
+    "UNCOMPRESSED_XATTRS",
+    "NO_XATTRS",
+    "COMPRESSOR_OPTIONS",
+    "UNCOMPRESSED_IDS"
+)
+
 @register()
 class FlagsCommand(Command):
     @staticmethod
@@ -15,33 +31,22 @@ class FlagsCommand(Command):
             return
             
         flags = self.explorer.superblock.flags
-        print(f"\nSuperblock flags: 0x{flags:04x}")
-        
-        # Define known flags
-        flag_descriptions = {
-            0x0001: "UNCOMPRESSED_INODES",
-            0x0002: "UNCOMPRESSED_DATA",
-            0x0004: "CHECK",
-            0x0008: "UNCOMPRESSED_FRAGMENTS",
-            0x0010: "NO_FRAGMENTS",
-            0x0020: "ALWAYS_FRAGMENTS",
-            0x0040: "DUPLICATES",
-            0x0080: "EXPORTABLE",
-            0x0100: "UNCOMPRESSED_XATTRS",
-            0x0200: "NO_XATTRS",
-            0x0400: "COMPRESSOR_OPTIONS",
-            0x0800: "UNCOMPRESSED_IDS"
-        }
+        lines = [f"\nSuperblock flags: 0x{flags:04x}"]
         
-        # Print active flags
+        # List active flags, visiting only the set bits (lowest first)
         active_flags = []
-        for flag_bit, description in flag_descriptions.items():
-            if flags & flag_bit:
-                active_flags.append(f"  - {description} (0x{flag_bit:04x})")
+        remaining = flags
+        while remaining:
+            flag_bit = remaining & -remaining
+            bit_index = flag_bit.bit_length() - 1
+            description = _FLAG_NAMES[bit_index] if bit_index < len(_FLAG_NAMES) else "UNKNOWN"
+            active_flags.append(f"  - {description} (0x{flag_bit:04x})")
+            remaining ^= flag_bit
         
         if active_flags:
-            print("Active flags:")
-            for flag in active_flags:
-                print(flag)
+            lines.append("Active flags:")
+            lines.extend(active_flags)
         else:
-            print("No flags are set.")
\ No newline at end of file
+            lines.append("No flags are set.")
+        
+        self._write_lines(lines)
\ No newline at end of file
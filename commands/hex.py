@@ -10,17 +10,19 @@ class HexCommand(Command):
         return "Show hex dump of the first bytes (default: 64)"
     
     def execute(self, *args) -> None:
-        bytes_to_show = 64  # Default
+        bytes_to_show = self._parse_byte_count(args)
+        if bytes_to_show is None:
+            return
         
-        if args and args[0].isdigit():
-            bytes_to_show = min(int(args[0]), len(self.explorer.raw_data))
+        lines = [f"\nHex dump of first {bytes_to_show} bytes:"]
         
-        print(f"\nHex dump of first {bytes_to_show} bytes:")
-        
-        # Simple hex dump
+        # Simple hex dump; both columns are formatted once for the whole dump
+        # in C, then sliced per row. Each byte takes 3 hex characters ("xx ").
+        data = memoryview(self.explorer.raw_data)[:bytes_to_show]
+        hex_text = data.hex(' ')
+        ascii_text = self._printable_ascii(data)
         for i in range(0, bytes_to_show, 16):
-            chunk = self.explorer.raw_data[i:min(i+16, bytes_to_show)]
-            hex_values = ' '.join(f'{b:02x}' for b in chunk)
-            ascii_values = ''.join(chr(b) if 32 <= b <= 126 else '.' for b in chunk)
-            
-            print(f"{i:04x}: {hex_values:<48} |{ascii_values}|")
\ No newline at end of file
+            hex_values = hex_text[3*i:3*i+47]
+            lines.append(f"{i:04x}: {hex_values:<48} |{ascii_text[i:i+16]}|")
+        
+        self._write_lines(lines)
\ No newline at end of file
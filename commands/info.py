@@ -1,9 +1,8 @@
 # commands/info.py - Info command
 
-import time
 from commands.base import Command
 from commands import register
-from squashfs import CompressionID
+from squashfs import compression_name
 
 @register()
 class InfoCommand(Command):
@@ -17,34 +16,30 @@ class InfoCommand(Command):
             return
             
         sb = self.explorer.superblock
-        print("\nSquashFS Superblock Information:")
-        print(f"  Magic:                0x{sb.magic:08x}")
-        print(f"  Inode Count:          {sb.inode_count}")
+        lines = ["\nSquashFS Superblock Information:"]
+        lines.append(f"  Magic:                0x{sb.magic:08x}")
+        lines.append(f"  Inode Count:          {sb.inode_count}")
         
         # Format date
-        date_str = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(sb.modification_time))
-        print(f"  Modification Time:    {date_str} UTC")
+        date_str = self._formatted_mtime(sb)
+        lines.append(f"  Modification Time:    {date_str} UTC")
         
-        print(f"  Block Size:           {sb.block_size} bytes")
-        print(f"  Fragment Entry Count: {sb.fragment_entry_count}")
+        lines.append(f"  Block Size:           {sb.block_size} bytes")
+        lines.append(f"  Fragment Entry Count: {sb.fragment_entry_count}")
         
-        # Get compression name
-        comp_name = "Unknown"
-        try:
-            comp_name = CompressionID(sb.compression_id).name
-        except ValueError:
-            comp_name = f"Unknown ({sb.compression_id})"
-        print(f"  Compression:          {comp_name}")
+        lines.append(f"  Compression:          {compression_name(sb.compression_id)}")
         
-        print(f"  Block Log:            {sb.block_log}")
-        print(f"  Flags:                0x{sb.flags:04x}")
-        print(f"  ID Count:             {sb.id_count}")
-        print(f"  Version:              {sb.version_major}.{sb.version_minor}")
-        print(f"  Root Inode Ref:       0x{sb.root_inode_ref:016x}")
-        print(f"  Bytes Used:           {sb.bytes_used} ({self._format_size(sb.bytes_used)})")
-        print(f"  ID Table Start:       0x{sb.id_table_start:016x}")
-        print(f"  XAttr ID Table Start: 0x{sb.xattr_id_table_start:016x}")
-        print(f"  Inode Table Start:    0x{sb.inode_table_start:016x}")
-        print(f"  Directory Table Start: 0x{sb.directory_table_start:016x}")
-        print(f"  Fragment Table Start: 0x{sb.fragment_table_start:016x}")
-        print(f"  Export Table Start:   0x{sb.export_table_start:016x}")
\ No newline at end of file
+        lines.append(f"  Block Log:            {sb.block_log}")
+        lines.append(f"  Flags:                0x{sb.flags:04x}")
+        lines.append(f"  ID Count:             {sb.id_count}")
+        lines.append(f"  Version:              {sb.version_major}.{sb.version_minor}")
+        lines.append(f"  Root Inode Ref:       0x{sb.root_inode_ref:016x}")
+        lines.append(f"  Bytes Used:           {sb.bytes_used} ({self._format_size(sb.bytes_used)})")
+        lines.append(f"  ID Table Start:       0x{sb.id_table_start:016x}")
+        lines.append(f"  XAttr ID Table Start: 0x{sb.xattr_id_table_start:016x}")
+        lines.append(f"  Inode Table Start:    0x{sb.inode_table_start:016x}")
+        lines.append(f"  Directory Table Start: 0x{sb.directory_table_start:016x}")
+        lines.append(f"  Fragment Table Start: 0x{sb.fragment_table_start:016x}")
+        lines.append(f"  Export Table Start:   0x{sb.export_table_start:016x}")
+        
+        self._write_lines(lines)
\ No newline at end of file
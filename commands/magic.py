@@ -1,6 +1,5 @@
 # commands/magic.py - Magic command
 
-import struct
 from commands.base import Command
 from commands import register
 from squashfs import SQUASHFS_MAGIC
@@ -16,17 +15,16 @@ class MagicCommand(Command):
             print("File is too small to contain a magic number.")
             return
             
-        magic = struct.unpack("<I", self.explorer.raw_data[:4])[0]
-        print(f"\nMagic number: 0x{magic:08x}")
+        magic = int.from_bytes(self.explorer.raw_data[:4], "little")
+        lines = [f"\nMagic number: 0x{magic:08x}"]
         
         if magic == SQUASHFS_MAGIC:
-            print("This is a valid SquashFS magic number (hsqs in ASCII).")
+            lines.append("This is a valid SquashFS magic number (hsqs in ASCII).")
         else:
-            print(f"Invalid magic number. Expected 0x{SQUASHFS_MAGIC:08x} (hsqs).")
+            lines.append(f"Invalid magic number. Expected 0x{SQUASHFS_MAGIC:08x} (hsqs).")
             
-            # Try to interpret as ASCII
-            try:
-                ascii_magic = ''.join(chr(b) if 32 <= b <= 126 else '.' for b in self.explorer.raw_data[:4])
-                print(f"ASCII interpretation: '{ascii_magic}'")
-            except:
-                pass
\ No newline at end of file
+            # Interpret as ASCII; translate() cannot fail on bytes
+            ascii_magic = self._printable_ascii(self.explorer.raw_data[:4])
+            lines.append(f"ASCII interpretation: '{ascii_magic}'")
+        
+        self._write_lines(lines)
\ No newline at end of file
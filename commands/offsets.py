@@ -15,10 +15,12 @@ class OffsetsCommand(Command):
             return
             
         sb = self.explorer.superblock
-        print("\nTable offsets:")
-        print(f"  ID Table:           0x{sb.id_table_start:016x}")
-        print(f"  XAttr ID Table:     0x{sb.xattr_id_table_start:016x}")
-        print(f"  Inode Table:        0x{sb.inode_table_start:016x}")
-        print(f"  Directory Table:    0x{sb.directory_table_start:016x}")
-        print(f"  Fragment Table:     0x{sb.fragment_table_start:016x}")
-        print(f"  Export Table:       0x{sb.export_table_start:016x}")
\ No newline at end of file
+        self._write_lines([
+            "\nTable offsets:",
+            f"  ID Table:           0x{sb.id_table_start:016x}",
+            f"  XAttr ID Table:     0x{sb.xattr_id_table_start:016x}",
+            f"  Inode Table:        0x{sb.inode_table_start:016x}",
+            f"  Directory Table:    0x{sb.directory_table_start:016x}",
+            f"  Fragment Table:     0x{sb.fragment_table_start:016x}",
+            f"  Export Table:       0x{sb.export_table_start:016x}"
+        ])
\ No newline at end of file
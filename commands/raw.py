@@ -3,6 +3,9 @@
 from commands.base import Command
 from commands import register
 
+# Right-aligned decimal strings for every byte value
+_DEC3 = tuple(f'{b:3d}' for b in range(256))
+
 @register()
 class RawCommand(Command):
     @staticmethod
@@ -10,14 +13,16 @@ class RawCommand(Command):
         return "Show raw bytes as integers (default: 64)"
     
     def execute(self, *args) -> None:
-        bytes_to_show = 64  # Default
-        
-        if args and args[0].isdigit():
-            bytes_to_show = min(int(args[0]), len(self.explorer.raw_data))
+        bytes_to_show = self._parse_byte_count(args)
+        if bytes_to_show is None:
+            return
         
-        print(f"\nRaw bytes (as integers) of first {bytes_to_show} bytes:")
+        lines = [f"\nRaw bytes (as integers) of first {bytes_to_show} bytes:"]
         
+        data = memoryview(self.explorer.raw_data)[:bytes_to_show]
         for i in range(0, bytes_to_show, 8):
-            chunk = self.explorer.raw_data[i:min(i+8, bytes_to_show)]
-            values = ' '.join(f'{b:3d}' for b in chunk)
-            print(f"{i:04x}: {values}")
\ No newline at end of file
+            chunk = data[i:i+8]
+            values = ' '.join(map(_DEC3.__getitem__, chunk))
+            lines.append(f"{i:04x}: {values}")
+        
+        self._write_lines(lines)
\ No newline at end of file
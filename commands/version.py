@@ -15,4 +15,4 @@ class VersionCommand(Command):
             return
             
         sb = self.explorer.superblock
-        print(f"\nSquashFS Version: {sb.version_major}.{sb.version_minor}")
\ No newline at end of file
+        self._write_lines([f"\nSquashFS Version: {sb.version_major}.{sb.version_minor}"])
\ No newline at end of file
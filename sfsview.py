@@ -1,12 +1,12 @@
 #!/usr/bin/env python3
-# tool.py - Main script for SquashFS Explorer
+# sfsview.py - Main script for SquashFS Explorer
 
 import sys
 import os
 import argparse
 import importlib
 import pkgutil
-from squashfs import SquashFSSuperblock, unpack_squashfs_superblock
+from squashfs import SUPERBLOCK_SIZE, SuperblockError, unpack_squashfs_superblock
 
 # Import all modules in the commands package to ensure decorators are processed
 import commands
@@ -15,7 +15,11 @@ for _, name, _ in pkgutil.iter_modules(commands.__path__):
         importlib.import_module(f'commands.{name}')
 
 # Access the populated command registry
-from commands import COMMAND_REGISTRY
+from commands import lookup
+
+
+# Number of leading image bytes kept in raw_data for the dump commands
+RAW_DATA_SIZE = 4096
 
 
 class SquashFSExplorer:
@@ -23,28 +27,40 @@ class SquashFSExplorer:
         self.squashfs_file = squashfs_file
         self.force = force
         self.superblock = None
-        self.raw_data = None
+        self.file_size = 0
+        self._raw_data = None
+        # Command instances, created on first use and reused afterwards
+        self._commands = {}
         
-        # Read the superblock
+        # Read only the superblock; raw_data is loaded when first needed
         with open(squashfs_file, "rb") as f:
-            # Read the first 4K for analysis
-            self.raw_data = f.read(4096)
+            self.file_size = os.fstat(f.fileno()).st_size
+            header = f.read(SUPERBLOCK_SIZE)
         
-        if len(self.raw_data) < 4:
-            print(f"Error: File is too small to be a valid SquashFS image (size: {len(self.raw_data)} bytes)")
+        if len(header) < 4:
+            print(f"Error: File is too small to be a valid SquashFS image (size: {len(header)} bytes)")
             if not force:
                 sys.exit(1)
         
-        self.superblock = unpack_squashfs_superblock(self.raw_data)
-        
-        if self.superblock:
-            print(f"Successfully opened {squashfs_file}")
-        else:
+        try:
+            self.superblock = unpack_squashfs_superblock(header)
+        except SuperblockError as e:
+            print(f"Warning: {e}")
             print(f"Warning: Could not parse a valid SquashFS superblock from {squashfs_file}")
             if not force:
                 print("Use --force to attempt exploration anyway.")
                 sys.exit(1)
             print("Continuing in limited mode due to --force flag.")
+        else:
+            print(f"Successfully opened {squashfs_file}")
+    
+    @property
+    def raw_data(self) -> bytes:
+        """The first RAW_DATA_SIZE bytes of the image, read on first access"""
+        if self._raw_data is None:
+            with open(self.squashfs_file, "rb") as f:
+                self._raw_data = f.read(RAW_DATA_SIZE)
+        return self._raw_data
     
     def run(self):
         """Start the interactive explorer"""
@@ -64,10 +80,13 @@ class SquashFSExplorer:
                 cmd = cmd_parts[0].lower()
                 args = cmd_parts[1:] if len(cmd_parts) > 1 else []
                 
-                if cmd in COMMAND_REGISTRY:
-                    # Create a command instance and execute it
-                    command_class = COMMAND_REGISTRY[cmd]
-                    command = command_class(self)
+                # Single registry probe; unknown commands fall through to None
+                command_class = lookup(cmd)
+                if command_class is not None:
+                    # Commands are stateless, so one instance per class is reused
+                    command = self._commands.get(command_class)
+                    if command is None:
+                        command = self._commands[command_class] = command_class(self)
                     command.execute(*args)
                 else:
                     print(f"Unknown command: {cmd}")
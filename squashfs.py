@@ -1,8 +1,11 @@
 # squashfs.py - Core SquashFS functionality
 
+import logging
 import struct
 from enum import IntEnum
-from typing import NamedTuple, Optional
+from typing import NamedTuple
+
+log = logging.getLogger(__name__)
 
 
 # Compression ID constants
@@ -15,6 +18,27 @@ class CompressionID(IntEnum):
     ZSTD = 6
 
 
+# Compression names and descriptions, keyed by raw compression ID
+COMPRESSION_NAMES = {cid.value: cid.name for cid in CompressionID}
+
+COMPRESSION_DESCRIPTIONS = {
+    CompressionID.GZIP: "Standard GZIP compression (zlib)",
+    CompressionID.LZMA: "LZMA compression, high compression ratio",
+    CompressionID.LZO: "LZO compression, optimized for speed",
+    CompressionID.XZ: "XZ compression, high compression ratio",
+    CompressionID.LZ4: "LZ4 compression, very fast decompression",
+    CompressionID.ZSTD: "Zstandard compression, good balance of speed and ratio"
+}
+
+
+def compression_name(compression_id: int) -> str:
+    """Return the compression method name for an ID, or 'Unknown (<id>)'"""
+    name = COMPRESSION_NAMES.get(compression_id)
+    if name is None:
+        name = f"Unknown ({compression_id})"
+    return name
+
+
 # Define the SquashFS superblock structure
 class SquashFSSuperblock(NamedTuple):
     magic: int
@@ -41,80 +65,70 @@ class SquashFSSuperblock(NamedTuple):
 # Magic number constant
 SQUASHFS_MAGIC = 0x73717368
 
+# Precompiled little-endian superblock layout (96 bytes on disk)
+_SB_STRUCT = struct.Struct("<IIIIIHHHHHHQQQQQQQQ")
+_MAGIC_STRUCT = struct.Struct("<I")
+
+# Size in bytes of an on-disk superblock
+SUPERBLOCK_SIZE = _SB_STRUCT.size
+
+
+class SuperblockError(Exception):
+    """Raised when data does not hold a valid SquashFS superblock"""
+
+
+class ShortSuperblockError(SuperblockError):
+    """Raised when data is too short to hold a complete superblock"""
 
-def unpack_squashfs_superblock(data: bytes) -> Optional[SquashFSSuperblock]:
+
+class BadMagicError(SuperblockError):
+    """Raised when the superblock magic number is not SQUASHFS_MAGIC"""
+
+
+def unpack_squashfs_superblock(data: bytes, offset: int = 0) -> SquashFSSuperblock:
     """
     Unpack bytes into a SquashFSSuperblock according to the SquashFS specification.
     
     Args:
         data: Bytes containing a SquashFS superblock (at least 96 bytes)
+        offset: Position of the superblock within data, so candidates in a
+            large buffer can be parsed in place without slicing
         
     Returns:
-        A SquashFSSuperblock instance with unpacked fields or None if unpacking fails
+        A SquashFSSuperblock instance with unpacked fields
+        
+    Raises:
+        ShortSuperblockError: If data is shorter than a superblock
+        BadMagicError: If the magic number does not match SQUASHFS_MAGIC
     """
+    if offset < 0:
+        raise ValueError(f"offset must not be negative: {offset}")
+    
     # Check if we have enough data for the superblock
-    if len(data) < 96:
-        print(f"Warning: Data too short for a complete superblock: expected at least 96 bytes, got {len(data)}")
-        # Try to unpack what we can for diagnostic purposes
-        try:
-            if len(data) >= 4:
-                magic = struct.unpack("<I", data[:4])[0]
-                if magic == SQUASHFS_MAGIC:
-                    print(f"Found valid magic number (0x{magic:08x}), but superblock is incomplete")
-                else:
-                    print(f"Invalid magic number: expected 0x{SQUASHFS_MAGIC:08x}, got 0x{magic:08x}")
-            return None
-        except Exception as e:
-            print(f"Error examining file header: {e}")
-            return None
+    available = len(data) - offset
+    if available < SUPERBLOCK_SIZE:
+        message = f"Data too short for a complete superblock: expected at least {SUPERBLOCK_SIZE} bytes, got {max(available, 0)}"
+        # Report what the header holds for diagnostic purposes
+        if available >= _MAGIC_STRUCT.size:
+            magic = _MAGIC_STRUCT.unpack_from(data, offset)[0]
+            if magic == SQUASHFS_MAGIC:
+                message += f" (found valid magic number 0x{magic:08x})"
+            else:
+                message += f" (invalid magic number 0x{magic:08x})"
+        raise ShortSuperblockError(message)
     
-    # Try to unpack with safe error handling
-    try:
-        # Unpack the superblock from bytes (little-endian)
-        # Note: The 'x' at the end is for padding - we need to make sure we have enough bytes
-        if len(data) < 97:  # We need 97 bytes including the padding byte
-            data = data + b'\x00' * (97 - len(data))  # Pad with zeros if needed
-            
-        unpacked = struct.unpack("<IIIIIHHHHHHQQQQQQQQx", data[:97])
-        
-        superblock = SquashFSSuperblock(
-            magic=unpacked[0],
-            inode_count=unpacked[1],
-            modification_time=unpacked[2],
-            block_size=unpacked[3],
-            fragment_entry_count=unpacked[4],
-            compression_id=unpacked[5],
-            block_log=unpacked[6],
-            flags=unpacked[7],
-            id_count=unpacked[8],
-            version_major=unpacked[9],
-            version_minor=unpacked[10],
-            root_inode_ref=unpacked[11],
-            bytes_used=unpacked[12],
-            id_table_start=unpacked[13],
-            xattr_id_table_start=unpacked[14],
-            inode_table_start=unpacked[15],
-            directory_table_start=unpacked[16],
-            fragment_table_start=unpacked[17],
-            export_table_start=unpacked[18]
-        )
-        
-        # Validate magic number
-        if superblock.magic != SQUASHFS_MAGIC:
-            print(f"Invalid magic number: expected 0x{SQUASHFS_MAGIC:08x}, got 0x{superblock.magic:08x}")
-            return None
-        
-        # Validate block_log against block_size
-        # We'll just warn instead of failing
-        if (1 << superblock.block_log) != superblock.block_size:
-            print(f"Warning: block_log ({superblock.block_log}) does not match block_size ({superblock.block_size})")
-        
-        return superblock
+    # Unpack the superblock from bytes (little-endian); the length check
+    # above guarantees unpack_from() has enough data. The Struct fields are
+    # in SquashFSSuperblock order, so the tuple maps onto it directly.
+    superblock = SquashFSSuperblock._make(_SB_STRUCT.unpack_from(data, offset))
+    
+    # Validate magic number
+    if superblock.magic != SQUASHFS_MAGIC:
+        raise BadMagicError(f"Invalid magic number: expected 0x{SQUASHFS_MAGIC:08x}, got 0x{superblock.magic:08x}")
+    
+    # Validate block_log against block_size
+    # We'll just warn instead of failing
+    if (1 << superblock.block_log) != superblock.block_size:
+        log.warning("block_log (%d) does not match block_size (%d)", superblock.block_log, superblock.block_size)
     
-    except struct.error as e:
-        print(f"Error unpacking superblock: {e}")
-        print("The file may not be a valid SquashFS image or may be corrupted.")
-        return None
-    except Exception as e:
-        print(f"Unexpected error: {e}")
-        return None
\ No newline at end of file
+    return superblock
\ No newline at end of file